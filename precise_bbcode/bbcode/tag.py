@@ -72,11 +72,11 @@ class BBCodeTagBase(type):
             # Check whether the tag is correctly defined according to a bbcode tag regex
             tag_re = bbcodde_standard_re if not new_tag._options.standalone \
                 else bbcodde_standalone_re
-            valid_bbcode_tag = re.search(tag_re, new_tag.definition_string)
+            valid_bbcode_tag = tag_re.search(new_tag.definition_string)
             if not valid_bbcode_tag:
                 raise InvalidBBCodeTag('The BBCode definition you provided is not valid')
 
-            re_groups = re.search(tag_re, new_tag.definition_string).groupdict()
+            re_groups = valid_bbcode_tag.groupdict()
 
             # The beginning and end tag names must be the same
             if not (new_tag._options.standalone or new_tag._options.newline_closes or
@@ -86,13 +86,13 @@ class BBCodeTag(models.Model):
         parser = get_parser()
 
         tag_re = bbcodde_standard_re if not self.standalone else bbcodde_standalone_re
-        valid_bbcode_tag = re.search(tag_re, self.tag_definition)
+        valid_bbcode_tag = tag_re.search(self.tag_definition)
         def_placeholders = re.findall(placeholder_re, self.tag_definition)
 
         # First, try to validate the tag according to the correct regex
         if not valid_bbcode_tag:
             raise ValidationError(_('The BBCode definition you provided is not valid'))
-        re_groups = re.search(tag_re, self.tag_definition).groupdict()
+        re_groups = valid_bbcode_tag.groupdict()
 
         # Validates the tag definition by trying to create the corresponding BBCode class
         try:
@@ -129,7 +129,7 @@ class BBCodeTag(models.Model):
     def save(self, *args, **kwargs):
         tag_re = bbcodde_standard_re if not self.standalone else bbcodde_standalone_re
         # Generate the tag name according to the tag definition
-        re_groups = re.search(tag_re, self.tag_definition).groupdict()
+        re_groups = tag_re.search(self.tag_definition).groupdict()
         self.tag_name = re_groups['start_name']
 
         super(BBCodeTag, self).save(*args, **kwargs)
@@ -0,0 +1,12 @@
+import pytest
+
+from precise_bbcode.bbcode import get_parser
+
+
+@pytest.fixture(scope='class')
+def bbcode_parser(request, django_db_setup, django_db_blocker):
+    # The first call to get_parser() loads the custom tags and smilies stored in the database, so
+    # the database access must be unblocked for class-scoped fixtures.
+    with django_db_blocker.unblock():
+        request.cls.parser = get_parser()
+    return request.cls.parser
@@ -7,7 +7,6 @@ from django.urls import reverse
 
 from precise_bbcode.bbcode import BBCodeParser
 from precise_bbcode.bbcode import BBCodeParserLoader
-from precise_bbcode.bbcode import get_parser
 from precise_bbcode.bbcode.exceptions import InvalidBBCodePlaholder
 from precise_bbcode.bbcode.exceptions import InvalidBBCodeTag
 from precise_bbcode.bbcode.tag import BBCodeTag as ParserBBCodeTag
@@ -56,21 +55,33 @@ class BarTag(ParserBBCodeTag):
         return '<div class="bar" style="color:{};">{}</div>'.format(option, value)
 
 
+_TAGS_TESTS = (
+    ('[fooalt]hello world![/fooalt]', '<pre>hello world!</pre>'),
+    ('[bar]hello world![/bar]', '<div class="bar">hello world!</div>'),
+    ('[fooalt]hello [bar]world![/bar][/fooalt]', '<pre>hello [bar]world![/bar]</pre>'),
+    (
+        '[bar]hello [fooalt]world![/fooalt][/bar]',
+        '<div class="bar">hello <pre>world!</pre></div>'
+    ),
+    ('[bar]안녕하세요![/bar]', '<div class="bar">안녕하세요!</div>'),
+)
+
+
 @pytest.mark.django_db
+@pytest.mark.usefixtures('bbcode_parser')
 class TestBbcodeTagPool(object):
-    TAGS_TESTS = (
-        ('[fooalt]hello world![/fooalt]', '<pre>hello world!</pre>'),
-        ('[bar]hello world![/bar]', '<div class="bar">hello world!</div>'),
-        ('[fooalt]hello [bar]world![/bar][/fooalt]', '<pre>hello [bar]world![/bar]</pre>'),
-        (
-            '[bar]hello [fooalt]world![/fooalt][/bar]',
-            '<div class="bar">hello <pre>world!</pre></div>'
-        ),
-        ('[bar]안녕하세요![/bar]', '<div class="bar">안녕하세요!</div>'),
-    )
-
-    def setup_method(self, method):
-        self.parser = get_parser()
+    TAGS_TESTS = _TAGS_TESTS
+
+    @pytest.fixture(scope='class', autouse=True)
+    def registered_tags(self, bbcode_parser, django_db_blocker):
+        with django_db_blocker.unblock():
+            tag_pool.register_tag(FooTagAlt)
+            tag_pool.register_tag(BarTag)
+        parser_loader = BBCodeParserLoader(parser=bbcode_parser)
+        parser_loader.init_bbcode_tags()
+        yield
+        tag_pool.unregister_tag(FooTagAlt)
+        tag_pool.unregister_tag(BarTag)
 
     def test_should_raise_if_a_tag_is_registered_twice(self):
         # Setup
@@ -117,16 +128,11 @@ class TestBbcodeTagPool(object):
         number_of_tags_after = len(tag_pool.get_tags())
         assert number_of_tags_before == number_of_tags_after
 
-    def test_tags_can_be_rendered(self):
-        # Setup
-        parser_loader = BBCodeParserLoader(parser=self.parser)
-        tag_pool.register_tag(FooTagAlt)
-        tag_pool.register_tag(BarTag)
-        parser_loader.init_bbcode_tags()
+    @pytest.mark.parametrize('bbcodes_text, expected_html_text', TAGS_TESTS)
+    def test_tags_can_be_rendered(self, bbcodes_text, expected_html_text):
         # Run & check
-        for bbcodes_text, expected_html_text in self.TAGS_TESTS:
-            result = self.parser.render(bbcodes_text)
-            assert result == expected_html_text
+        result = self.parser.render(bbcodes_text)
+        assert result == expected_html_text
 
     def test_can_disable_builtin_tags(self):
         # Setup
@@ -140,46 +146,43 @@ class TestBbcodeTagPool(object):
         bbcode_settings.BBCODE_DISABLE_BUILTIN_TAGS = False
 
 
+_INVALID_TAGS_TESTS = (
+    {},
+    {'name': 'it\'s a bad tag name'},
+    {'name': 'ooo', 'definition_string': '[ooo]{TEXT}[/ooo]'},
+    {'name': 'ooo', 'definition_string': 'bad definition', 'format_string': 'bad format string'},
+    {
+        'name': 'ooo',
+        'definition_string': '[ooo]{TEXT}[/aaa]',
+        'format_string': 'bad format string'
+    },
+    {'name': 'ooo', 'definition_string': '[ooo]{TEXT}[/ooo]', 'format_string': '<span></span>'},
+    {
+        'name': 'ooo',
+        'definition_string': '[ooo={TEXT}]{TEXT}[/ooo]',
+        'format_string': '<span>{TEXT}</span>'
+    },
+)
+
+
 @pytest.mark.django_db
+@pytest.mark.usefixtures('bbcode_parser')
 class TestBbcodeTag(object):
-    def setup_method(self, method):
-        self.parser = get_parser()
+    INVALID_TAGS_TESTS = _INVALID_TAGS_TESTS
 
-    def test_that_are_invalid_should_raise_at_runtime(self):
+    @pytest.mark.parametrize('tag_attrs', INVALID_TAGS_TESTS)
+    def test_that_are_invalid_should_raise_at_runtime(self, tag_attrs):
         # Run & check
         with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag1(ParserBBCodeTag):
-                pass
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag2(ParserBBCodeTag):
-                delattr(ParserBBCodeTag, 'name')
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag3(ParserBBCodeTag):
-                name = 'it\'s a bad tag name'
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag4(ParserBBCodeTag):
-                name = 'ooo'
-                definition_string = '[ooo]{TEXT}[/ooo]'
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag5(ParserBBCodeTag):
-                name = 'ooo'
-                definition_string = 'bad definition'
-                format_string = 'bad format string'
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag6(ParserBBCodeTag):
-                name = 'ooo'
-                definition_string = '[ooo]{TEXT}[/aaa]'
-                format_string = 'bad format string'
-        with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag7(ParserBBCodeTag):
-                name = 'ooo'
-                definition_string = '[ooo]{TEXT}[/ooo]'
-                format_string = '<span></span>'
+            type('ErrnoneousTag', (ParserBBCodeTag, ), dict(tag_attrs))
+
+    def test_without_name_should_raise_at_runtime(self, monkeypatch):
+        # Setup
+        monkeypatch.delattr(ParserBBCodeTag, 'name')
+        # Run & check
         with pytest.raises(InvalidBBCodeTag):
-            class ErrnoneousTag8(ParserBBCodeTag):
-                name = 'ooo'
-                definition_string = '[ooo={TEXT}]{TEXT}[/ooo]'
-                format_string = '<span>{TEXT}</span>'
+            class ErrnoneousTag(ParserBBCodeTag):
+                pass
 
     def test_containing_invalid_placeholders_should_raise_during_rendering(self):
         # Setup
@@ -193,144 +196,147 @@ class TestBbcodeTag(object):
             self.parser.render('[bad]apple[/bad]')
 
 
+_ERRONEOUS_TAGS_TESTS = (
+    {'tag_definition': '[tag]', 'html_replacement': ''},
+    {'tag_definition': 'it\s not a tag', 'html_replacement': ''},
+    {'tag_definition': '[first]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
+    {'tag_definition': '[t2y={TEXT1}]{TEXT1}[/t2y]', 'html_replacement': '<b>{TEXT1}</b>'},
+    {
+        'tag_definition': '[tag2]{TEXT1}[/tag2]',
+        'html_replacement': '<p>{TEXT1}</p>',
+        'standalone': True
+    },
+    {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
+    {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
+    {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT2}</p>'},
+    {
+        'tag_definition': '[start={TEXT1}]{TEXT1}[/end]',
+        'html_replacement': '<p style="color:{TEXT1};">{TEXT1}</p>'
+    },
+    {
+        'tag_definition': '[justify]{TEXT1}[/justify]',
+        'html_replacement': '<div style="text-align:justify;"></div>'
+    },
+    {
+        'tag_definition': '[center][/center]',
+        'html_replacement': '<div style="text-align:center;">{TEXT1}</div>'
+    },
+    {
+        'tag_definition': '[spe={COLOR}]{TEXT}[/spe]',
+        'html_replacement': '<div class="spe">{TEXT}</div>'
+    },
+    {
+        'tag_definition': '[spe]{TEXT}[/spe]',
+        'html_replacement': '<div class="spe" style="color:{COLOR};">{TEXT}</div>'
+    },
+    {'tag_definition': '[spe]{UNKNOWN}[/spe]', 'html_replacement': '<div>{UNKNOWN}</div>'},
+    {'tag_definition': '[io]{TEXT#1}[/io]', 'html_replacement': '<span>{TEXT#1}</span>'},
+    {'tag_definition': '[io]{TEXTa}[/io]', 'html_replacement': '<span>{TEXTb}</span>'},
+    {'tag_definition': '[ test]{TEXT1}[/test]', 'html_replacement': '<span>{TEXT}</span>'},
+    {'tag_definition': '[test ]{TEXT1}[/test]', 'html_replacement': '<span>{TEXT}</span>'},
+    {'tag_definition': '[test]{TEXT1}[/ test ]', 'html_replacement': '<span>{TEXT}</span>'},
+    {'tag_definition': '[test]{TEXT1}[/test ]', 'html_replacement': '<span>{TEXT}</span>'},
+    {'tag_definition': '[foo]{TEXT1}[/foo ]', 'html_replacement': '<span>{TEXT}</span>'},
+    {
+        'tag_definition': '[bar]{TEXT}[/bar]',  # Already registered
+        'html_replacement': '<span>{TEXT}</span>'
+    },
+)
+
+
+_VALID_TAG_TESTS = (
+    {'tag_definition': '[pre]{TEXT}[/pre]', 'html_replacement': '<pre>{TEXT}</pre>'},
+    {
+        'tag_definition': '[pre2={COLOR}]{TEXT1}[/pre2]',
+        'html_replacement': '<pre style="color:{COLOR};">{TEXT1}</pre>'
+    },
+    {'tag_definition': '[hrcustom]', 'html_replacement': '<hr />', 'standalone': True},
+    {
+        'tag_definition': '[oo]{TEXT}',
+        'html_replacement': '<li>{TEXT}</li>',
+        'same_tag_closes': True
+    },
+    {
+        'tag_definition': '[h]{TEXT}[/h]',
+        'html_replacement': '<strong>{TEXT}</strong>',
+        'helpline': 'Display your text in bold'
+    },
+    {
+        'tag_definition': '[hbold]{TEXT}[/hbold]',
+        'html_replacement': '<strong>{TEXT}</strong>',
+        'display_on_editor': False
+    },
+    {
+        'tag_definition': '[pre3]{TEXT}[/pre3]',
+        'html_replacement': '<pre>{TEXT}</pre>',
+        'newline_closes': True
+    },
+    {
+        'tag_definition': '[pre4]{TEXT}[/pre4]',
+        'html_replacement': '<pre>{TEXT}</pre>',
+        'same_tag_closes': True
+    },
+    {
+        'tag_definition': '[troll]{TEXT}[/troll]',
+        'html_replacement': '<div class="troll">{TEXT}</div>',
+        'end_tag_closes': True
+    },
+    {
+        'tag_definition': '[troll1]{TEXT}[/troll1]',
+        'html_replacement': '<div class="troll">{TEXT}</div>',
+        'transform_newlines': True
+    },
+    {
+        'tag_definition': '[idea]{TEXT1}[/idea]',
+        'html_replacement': '<div class="idea">{TEXT1}</div>',
+        'render_embedded': False
+    },
+    {
+        'tag_definition': '[idea1]{TEXT1}[/idea1]',
+        'html_replacement': '<div class="idea">{TEXT1}</div>',
+        'escape_html': False
+    },
+    {
+        'tag_definition': '[link]{URL}[/link]',
+        'html_replacement': '<div class="idea">{URL}</div>',
+        'replace_links': False
+    },
+    {
+        'tag_definition': '[link1]{URL}[/link1]',
+        'html_replacement': '<div class="idea">{URL}</div>',
+        'strip': True
+    },
+    {
+        'tag_definition': '[mailto]{EMAIL}[/mailto]',
+        'html_replacement': '<a href="mailto:{EMAIL}">{EMAIL}</a>',
+        'swallow_trailing_newline': True
+    },
+    {
+        'tag_definition': '[food]{CHOICE=apple,tomato,orange}[/food]',
+        'html_replacement': '<span>{CHOICE=apple,tomato,orange}</span>'
+    },
+    {
+        'tag_definition': '[food++={CHOICE2=red,blue}]{CHOICE1=apple,tomato,orange}[/food++]',
+        'html_replacement': (
+            '<span data-choice="{CHOICE2=red,blue}">{CHOICE1=apple,tomato,orange}</span>'
+        )
+    },
+    {
+        'tag_definition': '[big]{RANGE=2,15}[/big]',
+        'html_replacement': '<span>{RANGE=2,15}</span>'
+    },
+    {
+        'tag_definition': '[b]{TEXT}[/b]',  # Default tag overriding
+        'html_replacement': '<b>{TEXT}</b>'
+    },
+)
+
+
 @pytest.mark.django_db
+@pytest.mark.usefixtures('bbcode_parser')
 class TestDbBbcodeTag(object):
-    ERRONEOUS_TAGS_TESTS = (
-        {'tag_definition': '[tag]', 'html_replacement': ''},
-        {'tag_definition': 'it\s not a tag', 'html_replacement': ''},
-        {'tag_definition': '[first]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
-        {'tag_definition': '[t2y={TEXT1}]{TEXT1}[/t2y]', 'html_replacement': '<b>{TEXT1}</b>'},
-        {
-            'tag_definition': '[tag2]{TEXT1}[/tag2]',
-            'html_replacement': '<p>{TEXT1}</p>',
-            'standalone': True
-        },
-        {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
-        {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT1}</p>'},
-        {'tag_definition': '[start]{TEXT1}[/end]', 'html_replacement': '<p>{TEXT2}</p>'},
-        {
-            'tag_definition': '[start={TEXT1}]{TEXT1}[/end]',
-            'html_replacement': '<p style="color:{TEXT1};">{TEXT1}</p>'
-        },
-        {
-            'tag_definition': '[justify]{TEXT1}[/justify]',
-            'html_replacement': '<div style="text-align:justify;"></div>'
-        },
-        {
-            'tag_definition': '[center][/center]',
-            'html_replacement': '<div style="text-align:center;">{TEXT1}</div>'
-        },
-        {
-            'tag_definition': '[spe={COLOR}]{TEXT}[/spe]',
-            'html_replacement': '<div class="spe">{TEXT}</div>'
-        },
-        {
-            'tag_definition': '[spe]{TEXT}[/spe]',
-            'html_replacement': '<div class="spe" style="color:{COLOR};">{TEXT}</div>'
-        },
-        {'tag_definition': '[spe]{UNKNOWN}[/spe]', 'html_replacement': '<div>{UNKNOWN}</div>'},
-        {'tag_definition': '[io]{TEXT#1}[/io]', 'html_replacement': '<span>{TEXT#1}</span>'},
-        {'tag_definition': '[io]{TEXTa}[/io]', 'html_replacement': '<span>{TEXTb}</span>'},
-        {'tag_definition': '[ test]{TEXT1}[/test]', 'html_replacement': '<span>{TEXT}</span>'},
-        {'tag_definition': '[test ]{TEXT1}[/test]', 'html_replacement': '<span>{TEXT}</span>'},
-        {'tag_definition': '[test]{TEXT1}[/ test ]', 'html_replacement': '<span>{TEXT}</span>'},
-        {'tag_definition': '[test]{TEXT1}[/test ]', 'html_replacement': '<span>{TEXT}</span>'},
-        {'tag_definition': '[foo]{TEXT1}[/foo ]', 'html_replacement': '<span>{TEXT}</span>'},
-        {
-            'tag_definition': '[bar]{TEXT}[/bar]',  # Already registered
-            'html_replacement': '<span>{TEXT}</span>'
-        },
-    )
-
-    VALID_TAG_TESTS = (
-        {'tag_definition': '[pre]{TEXT}[/pre]', 'html_replacement': '<pre>{TEXT}</pre>'},
-        {
-            'tag_definition': '[pre2={COLOR}]{TEXT1}[/pre2]',
-            'html_replacement': '<pre style="color:{COLOR};">{TEXT1}</pre>'
-        },
-        {'tag_definition': '[hrcustom]', 'html_replacement': '<hr />', 'standalone': True},
-        {
-            'tag_definition': '[oo]{TEXT}',
-            'html_replacement': '<li>{TEXT}</li>',
-            'same_tag_closes': True
-        },
-        {
-            'tag_definition': '[h]{TEXT}[/h]',
-            'html_replacement': '<strong>{TEXT}</strong>',
-            'helpline': 'Display your text in bold'
-        },
-        {
-            'tag_definition': '[hbold]{TEXT}[/hbold]',
-            'html_replacement': '<strong>{TEXT}</strong>',
-            'display_on_editor': False
-        },
-        {
-            'tag_definition': '[pre3]{TEXT}[/pre3]',
-            'html_replacement': '<pre>{TEXT}</pre>',
-            'newline_closes': True
-        },
-        {
-            'tag_definition': '[pre4]{TEXT}[/pre4]',
-            'html_replacement': '<pre>{TEXT}</pre>',
-            'same_tag_closes': True
-        },
-        {
-            'tag_definition': '[troll]{TEXT}[/troll]',
-            'html_replacement': '<div class="troll">{TEXT}</div>',
-            'end_tag_closes': True
-        },
-        {
-            'tag_definition': '[troll1]{TEXT}[/troll1]',
-            'html_replacement': '<div class="troll">{TEXT}</div>',
-            'transform_newlines': True
-        },
-        {
-            'tag_definition': '[idea]{TEXT1}[/idea]',
-            'html_replacement': '<div class="idea">{TEXT1}</div>',
-            'render_embedded': False
-        },
-        {
-            'tag_definition': '[idea1]{TEXT1}[/idea1]',
-            'html_replacement': '<div class="idea">{TEXT1}</div>',
-            'escape_html': False
-        },
-        {
-            'tag_definition': '[link]{URL}[/link]',
-            'html_replacement': '<div class="idea">{URL}</div>',
-            'replace_links': False
-        },
-        {
-            'tag_definition': '[link1]{URL}[/link1]',
-            'html_replacement': '<div class="idea">{URL}</div>',
-            'strip': True
-        },
-        {
-            'tag_definition': '[mailto]{EMAIL}[/mailto]',
-            'html_replacement': '<a href="mailto:{EMAIL}">{EMAIL}</a>',
-            'swallow_trailing_newline': True
-        },
-        {
-            'tag_definition': '[food]{CHOICE=apple,tomato,orange}[/food]',
-            'html_replacement': '<span>{CHOICE=apple,tomato,orange}</span>'
-        },
-        {
-            'tag_definition': '[food++={CHOICE2=red,blue}]{CHOICE1=apple,tomato,orange}[/food++]',
-            'html_replacement': (
-                '<span data-choice="{CHOICE2=red,blue}">{CHOICE1=apple,tomato,orange}</span>'
-            )
-        },
-        {
-            'tag_definition': '[big]{RANGE=2,15}[/big]',
-            'html_replacement': '<span>{RANGE=2,15}</span>'
-        },
-        {
-            'tag_definition': '[b]{TEXT}[/b]',  # Default tag overriding
-            'html_replacement': '<b>{TEXT}</b>'
-        },
-    )
-
-    def setup_method(self, method):
-        self.parser = get_parser()
+    ERRONEOUS_TAGS_TESTS = _ERRONEOUS_TAGS_TESTS
+    VALID_TAG_TESTS = _VALID_TAG_TESTS
 
     def test_should_not_save_invalid_tags(self):
         # Run & check
@@ -380,10 +386,7 @@ class TestDbBbcodeTag(object):
         tag = BBCodeTag(**tag_dict)
         tag.save()
 
-        admin_user = User.objects.create_user('admin', 'admin@admin.io', 'adminpass')
-        admin_user.is_staff = True
-        admin_user.is_superuser = True
-        admin_user.save()
+        User.objects.create_superuser('admin', 'admin@admin.io', 'adminpass')
         client = Client()
         client.login(username='admin', password='adminpass')
         url = reverse('admin:precise_bbcode_bbcodetag_changelist')